@@ -43,18 +43,20 @@ from mapie.regression import MapieRegressor
 demand_df = pd.read_csv(
     "../../data/demand_temperature.csv", parse_dates=True, index_col=0
 )
-demand_df["Date"] = pd.to_datetime(demand_df.index)
-demand_df["Weekofyear"] = demand_df.Date.dt.isocalendar().week.astype("int64")
-demand_df["Weekday"] = demand_df.Date.dt.isocalendar().day.astype("int64")
+demand_df["Date"] = demand_df.index
+isocalendar = demand_df.Date.dt.isocalendar()
+demand_df["Weekofyear"] = isocalendar.week.astype("int64")
+demand_df["Weekday"] = isocalendar.day.astype("int64")
 demand_df["Hour"] = demand_df.index.hour
 
 # Train/validation/test split
 num_test_steps = 24 * 7 * 2
 demand_train = demand_df.iloc[:-num_test_steps, :].copy()
 demand_test = demand_df.iloc[-num_test_steps:, :].copy()
-X_train = demand_train.loc[:, ["Weekofyear", "Weekday", "Hour", "Temperature"]]
+features = ["Weekofyear", "Weekday", "Hour", "Temperature"]
+X_train = demand_train.loc[:, features]
 y_train = demand_train["Demand"]
-X_test = demand_test.loc[:, ["Weekofyear", "Weekday", "Hour", "Temperature"]]
+X_test = demand_test.loc[:, features]
 y_test = demand_test["Demand"]
 
 # CV parameter search
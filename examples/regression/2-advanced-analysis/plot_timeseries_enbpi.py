@@ -41,7 +41,9 @@ from mapie.metrics import (regression_coverage_score,
 from mapie.subsample import BlockBootstrap
 from mapie.regression import MapieTimeSeriesRegressor
 
-warnings.simplefilter("ignore")
+# Only silence the warnings raised by MAPIE on the resamplings: warnings
+# from pandas or scikit-learn remain visible.
+warnings.filterwarnings("ignore", module="mapie")
 
 
 # Load input data and feature engineering
@@ -51,9 +53,10 @@ url_file = (
 )
 demand_df = pd.read_csv(url_file, parse_dates=True, index_col=0)
 
-demand_df["Date"] = pd.to_datetime(demand_df.index)
-demand_df["Weekofyear"] = demand_df.Date.dt.isocalendar().week.astype("int64")
-demand_df["Weekday"] = demand_df.Date.dt.isocalendar().day.astype("int64")
+demand_df["Date"] = demand_df.index
+isocalendar = demand_df.Date.dt.isocalendar()
+demand_df["Weekofyear"] = isocalendar.week.astype("int64")
+demand_df["Weekday"] = isocalendar.day.astype("int64")
 demand_df["Hour"] = demand_df.index.hour
 n_lags = 5
 for hour in range(1, n_lags):
@@ -67,10 +70,9 @@ features = ["Weekofyear", "Weekday", "Hour", "Temperature"] + [
     f"Lag_{hour}" for hour in range(1, n_lags)
 ]
 
-X_train = demand_train.loc[
-    ~np.any(demand_train[features].isnull(), axis=1), features
-]
-y_train = demand_train.loc[X_train.index, "Demand"]
+train_mask = demand_train[features].notnull().to_numpy().all(axis=1)
+X_train = demand_train.loc[train_mask, features]
+y_train = demand_train.loc[train_mask, "Demand"]
 X_test = demand_test.loc[:, features]
 y_test = demand_test["Demand"]
 
@@ -129,7 +131,12 @@ width_npfit_enbpi = regression_mean_width_score(
 )
 
 print("EnbPI with partial_fit, width optimization")
-mapie_enpbi = mapie_enpbi.fit(X_train, y_train)
+# The test set is sliced at every step: work on NumPy arrays to avoid the
+# overhead of pandas indexing inside the loop.
+X_train_np, y_train_np = X_train.to_numpy(), y_train.to_numpy()
+X_test_np, y_test_np = X_test.to_numpy(), y_test.to_numpy()
+
+mapie_enpbi = mapie_enpbi.fit(X_train_np, y_train_np)
 y_pred_pfit_enbpi = np.zeros(y_pred_npfit_enbpi.shape)
 y_pis_pfit_enbpi = np.zeros(y_pis_npfit_enbpi.shape)
 
@@ -138,19 +145,19 @@ step_size = 1
     y_pred_pfit_enbpi[:step_size],
     y_pis_pfit_enbpi[:step_size, :, :],
 ) = mapie_enpbi.predict(
-    X_test.iloc[:step_size, :], alpha=alpha, ensemble=True, optimize_beta=True
+    X_test_np[:step_size], alpha=alpha, ensemble=True, optimize_beta=True
 )
 
-for step in range(step_size, len(X_test), step_size):
+for step in range(step_size, len(X_test_np), step_size):
     mapie_enpbi.partial_fit(
-        X_test.iloc[(step - step_size):step, :],
-        y_test.iloc[(step - step_size):step],
+        X_test_np[(step - step_size):step],
+        y_test_np[(step - step_size):step],
     )
     (
         y_pred_pfit_enbpi[step:step + step_size],
         y_pis_pfit_enbpi[step:step + step_size, :, :],
     ) = mapie_enpbi.predict(
-        X_test.iloc[step:(step + step_size), :],
+        X_test_np[step:(step + step_size)],
         alpha=alpha,
         ensemble=True,
         optimize_beta=True,
@@ -56,7 +56,9 @@ from mapie.metrics import (regression_coverage_score,
 from mapie.subsample import BlockBootstrap
 from mapie.regression import MapieTimeSeriesRegressor
 
-warnings.simplefilter("ignore")
+# Only silence the warnings raised by MAPIE on the resamplings: warnings
+# from pandas or scikit-learn remain visible.
+warnings.filterwarnings("ignore", module="mapie")
 
 
 ##############################################################################
@@ -77,9 +79,10 @@ url_file = (
 demand_df = pd.read_csv(
     url_file, parse_dates=True, index_col=0
 )
-demand_df["Date"] = pd.to_datetime(demand_df.index)
-demand_df["Weekofyear"] = demand_df.Date.dt.isocalendar().week.astype("int64")
-demand_df["Weekday"] = demand_df.Date.dt.isocalendar().day.astype("int64")
+demand_df["Date"] = demand_df.index
+isocalendar = demand_df.Date.dt.isocalendar()
+demand_df["Weekofyear"] = isocalendar.week.astype("int64")
+demand_df["Weekday"] = isocalendar.day.astype("int64")
 demand_df["Hour"] = demand_df.index.hour
 n_lags = 5
 for hour in range(1, n_lags):
@@ -91,7 +94,7 @@ for hour in range(1, n_lags):
 # It aims at simulating an effect, such as blackout or lockdown due to a
 # pandemic, that was not taken into account by the model during its training.
 
-demand_df.Demand.iloc[-int(num_test_steps/2):] -= 2
+demand_df.loc[demand_df.index[-int(num_test_steps/2):], "Demand"] -= 2
 
 ##############################################################################
 # The last week of the dataset is considered as test set, the remaining data
@@ -102,10 +105,9 @@ demand_test = demand_df.iloc[-num_test_steps:, :].copy()
 features = ["Weekofyear", "Weekday", "Hour", "Temperature"]
 features += [f"Lag_{hour}" for hour in range(1, n_lags)]
 
-X_train = demand_train.loc[
-    ~np.any(demand_train[features].isnull(), axis=1), features
-]
-y_train = demand_train.loc[X_train.index, "Demand"]
+train_mask = demand_train[features].notnull().to_numpy().all(axis=1)
+X_train = demand_train.loc[train_mask, features]
+y_train = demand_train.loc[train_mask, "Demand"]
 X_test = demand_test.loc[:, features]
 y_test = demand_test["Demand"]
 
@@ -209,9 +211,13 @@ width_npfit = regression_mean_width_score(
 ##############################################################################
 # Let's now estimate prediction intervals with partial fit. As discussed
 # previously, the update of the residuals and the one-step ahead predictions
-# are performed sequentially in a loop.
+# are performed sequentially in a loop. As the test set is sliced at every
+# step, we work on NumPy arrays rather than on the pandas objects.
 
-mapie_enbpi = mapie_enbpi.fit(X_train, y_train)
+X_train_np, y_train_np = X_train.to_numpy(), y_train.to_numpy()
+X_test_np, y_test_np = X_test.to_numpy(), y_test.to_numpy()
+
+mapie_enbpi = mapie_enbpi.fit(X_train_np, y_train_np)
 
 y_pred_pfit = np.zeros(y_pred_npfit.shape)
 y_pis_pfit = np.zeros(y_pis_npfit.shape)
@@ -219,18 +225,18 @@ conformity_scores_pfit = []
 lower_quantiles_pfit = []
 higher_quantiles_pfit = []
 y_pred_pfit[:gap], y_pis_pfit[:gap, :, :] = mapie_enbpi.predict(
-    X_test.iloc[:gap, :], alpha=alpha, ensemble=True, optimize_beta=True
+    X_test_np[:gap], alpha=alpha, ensemble=True, optimize_beta=True
 )
-for step in range(gap, len(X_test), gap):
+for step in range(gap, len(X_test_np), gap):
     mapie_enbpi.partial_fit(
-        X_test.iloc[(step - gap):step, :],
-        y_test.iloc[(step - gap):step],
+        X_test_np[(step - gap):step],
+        y_test_np[(step - gap):step],
     )
     (
         y_pred_pfit[step:step + gap],
         y_pis_pfit[step:step + gap, :, :],
     ) = mapie_enbpi.predict(
-        X_test.iloc[step:(step + gap), :],
+        X_test_np[step:(step + gap)],
         alpha=alpha,
         ensemble=True,
         optimize_beta=True
@@ -42,7 +42,7 @@ def compute_risk_recall(
             "y should be a 2d array, got an array of shape "
             "{} instead.".format(y_pred_proba.shape)
         )
-    if not np.array_equal(y_pred_proba.shape[:-1], y.shape):
+    if y_pred_proba.shape[:-1] != y.shape:
         raise ValueError(
             "y and y_pred_proba could not be broadcast."
         )
@@ -100,7 +100,7 @@ def compute_risk_precision(
             "y should be a 2d array, got an array of shape "
             "{} instead.".format(y_pred_proba.shape)
         )
-    if not np.array_equal(y_pred_proba.shape[:-1], y.shape):
+    if y_pred_proba.shape[:-1] != y.shape:
         raise ValueError(
             "y and y_pred_proba could not be broadcast."
         )
@@ -76,7 +76,10 @@ class MapieTimeSeriesRegressor(MapieRegressor):
         -------
             The conformity scores corresponding to the input data set.
         """
-        y_pred, _ = super().predict(X, alpha=0.5, ensemble=True)
+        self._check_ensemble(ensemble=True)
+        y_pred = self.estimator_.predict(
+            X, ensemble=True, return_multi_pred=False
+        )
         return np.asarray(y) - np.asarray(y_pred)
 
     def _beta_optimize(
@@ -190,7 +193,8 @@ class MapieTimeSeriesRegressor(MapieRegressor):
     ) -> MapieTimeSeriesRegressor:
         """
         Update the ``conformity_scores_`` attribute when new data with known
-        labels are available.
+        labels are available. The fitted estimators are left unchanged:
+        no model is refitted on the new data.
         Note: Don't use ``partial_fit`` with samples of the training set.
 
         Parameters
@@ -283,11 +287,10 @@ class MapieTimeSeriesRegressor(MapieRegressor):
         check_is_fitted(self, self.fit_attributes)
         self._check_ensemble(ensemble)
         alpha = cast(Optional[NDArray], check_alpha(alpha))
-        y_pred = self.estimator_.single_estimator_.predict(X)
         n = len(self.conformity_scores_)
 
         if alpha is None:
-            return np.array(y_pred)
+            return np.array(self.estimator_.single_estimator_.predict(X))
 
         alpha_np = cast(NDArray, alpha)
         check_alpha_and_n_samples(alpha_np, n)
@@ -318,18 +321,22 @@ class MapieTimeSeriesRegressor(MapieRegressor):
 
         if self.method in self.no_agg_methods_ \
                 or self.cv in self.no_agg_cv_:
+            y_pred = self.estimator_.single_estimator_.predict(X)
             y_pred_low = y_pred[:, np.newaxis] + lower_quantiles
             y_pred_up = y_pred[:, np.newaxis] + higher_quantiles
         else:
             y_pred_multi = self.estimator_._pred_multi(X)
             pred = aggregate_all(self.agg_function, y_pred_multi)
-            lower_bounds, upper_bounds = pred, pred
 
-            y_pred_low = lower_bounds.reshape(-1, 1) + lower_quantiles
-            y_pred_up = upper_bounds.reshape(-1, 1) + higher_quantiles
+            y_pred_low = pred.reshape(-1, 1) + lower_quantiles
+            y_pred_up = pred.reshape(-1, 1) + higher_quantiles
 
+            # The ensembled predictions are the aggregated ones, so the
+            # single estimator is only evaluated when they are not wanted.
             if ensemble:
-                y_pred = aggregate_all(self.agg_function, y_pred_multi)
+                y_pred = pred
+            else:
+                y_pred = self.estimator_.single_estimator_.predict(X)
 
         return y_pred, np.stack([y_pred_low, y_pred_up], axis=1)
 
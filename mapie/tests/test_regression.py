@@ -38,6 +38,8 @@ k = np.ones(shape=(5, X.shape[1]))
 METHODS = ["naive", "base", "plus", "minmax"]
 
 random_state = 1
+KFOLD = KFold(n_splits=3, shuffle=True, random_state=random_state)
+SUBSAMPLE = Subsample(n_resamplings=30, random_state=random_state)
 
 Params = TypedDict(
     "Params",
@@ -88,42 +90,42 @@ STRATEGIES = {
     "cv": Params(
         method="base",
         agg_function="mean",
-        cv=KFold(n_splits=3, shuffle=True, random_state=random_state),
+        cv=KFOLD,
         test_size=None,
         random_state=random_state
     ),
     "cv_plus": Params(
         method="plus",
         agg_function="mean",
-        cv=KFold(n_splits=3, shuffle=True, random_state=random_state),
+        cv=KFOLD,
         test_size=None,
         random_state=random_state
     ),
     "cv_minmax": Params(
         method="minmax",
         agg_function="mean",
-        cv=KFold(n_splits=3, shuffle=True, random_state=random_state),
+        cv=KFOLD,
         test_size=None,
         random_state=random_state
     ),
     "jackknife_plus_ab": Params(
         method="plus",
         agg_function="mean",
-        cv=Subsample(n_resamplings=30, random_state=random_state),
+        cv=SUBSAMPLE,
         test_size=None,
         random_state=random_state
     ),
     "jackknife_minmax_ab": Params(
         method="minmax",
         agg_function="mean",
-        cv=Subsample(n_resamplings=30, random_state=random_state),
+        cv=SUBSAMPLE,
         test_size=None,
         random_state=random_state
     ),
     "jackknife_plus_median_ab": Params(
         method="plus",
         agg_function="median",
-        cv=Subsample(n_resamplings=30, random_state=random_state),
+        cv=SUBSAMPLE,
         test_size=None,
         random_state=random_state
     ),
@@ -162,6 +164,27 @@ COVERAGES = {
 }
 
 
+FittedStrategy = Tuple[str, MapieRegressor, MapieRegressor]
+
+
+@pytest.fixture
+def strategy_params(request: pytest.FixtureRequest) -> Params:
+    """Return the parameters of the strategy named by ``request.param``."""
+    return STRATEGIES[request.param]
+
+
+@pytest.fixture(scope="module", params=[*STRATEGIES])
+def fitted_strategy(request: pytest.FixtureRequest) -> FittedStrategy:
+    """
+    Fit, once per strategy, the MapieRegressor shared by the tests
+    on ``(X, y)`` and on ``(X_toy, y_toy)``.
+    """
+    strategy = request.param
+    mapie_reg = MapieRegressor(**STRATEGIES[strategy]).fit(X, y)
+    mapie_reg_toy = MapieRegressor(**STRATEGIES[strategy]).fit(X_toy, y_toy)
+    return strategy, mapie_reg, mapie_reg_toy
+
+
 def test_default_parameters() -> None:
     """Test default values of input parameters."""
     mapie_reg = MapieRegressor()
@@ -169,11 +192,11 @@ def test_default_parameters() -> None:
     assert mapie_reg.method == "plus"
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_valid_estimator(strategy: str) -> None:
+@pytest.mark.parametrize("strategy_params", [*STRATEGIES], indirect=True)
+def test_valid_estimator(strategy_params: Params) -> None:
     """Test that valid estimators are not corrupted, for all strategies."""
     mapie_reg = MapieRegressor(
-        estimator=DummyRegressor(), **STRATEGIES[strategy]
+        estimator=DummyRegressor(), **strategy_params
     )
     mapie_reg.fit(X_toy, y_toy)
     assert isinstance(mapie_reg.estimator_.single_estimator_, DummyRegressor)
@@ -233,20 +256,21 @@ def test_too_large_cv(cv: Any) -> None:
         mapie_reg.fit(X_toy, y_toy)
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-@pytest.mark.parametrize("dataset", [(X, y), (X_toy, y_toy)])
+@pytest.mark.parametrize("toy", [False, True])
 @pytest.mark.parametrize("alpha", [0.2, [0.2, 0.4], (0.2, 0.4)])
 def test_predict_output_shape(
-    strategy: str, alpha: Any, dataset: Tuple[NDArray, NDArray]
+    fitted_strategy: FittedStrategy, alpha: Any, toy: bool
 ) -> None:
     """Test predict output shape."""
-    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
-    (X, y) = dataset
-    mapie_reg.fit(X, y)
-    y_pred, y_pis = mapie_reg.predict(X, alpha=alpha)
+    _, mapie_reg, mapie_reg_toy = fitted_strategy
+    if toy:
+        mapie_reg, X_test = mapie_reg_toy, X_toy
+    else:
+        X_test = X
+    y_pred, y_pis = mapie_reg.predict(X_test, alpha=alpha)
     n_alpha = len(alpha) if hasattr(alpha, "__len__") else 1
-    assert y_pred.shape == (X.shape[0],)
-    assert y_pis.shape == (X.shape[0], 2, n_alpha)
+    assert y_pred.shape == (X_test.shape[0],)
+    assert y_pis.shape == (X_test.shape[0], 2, n_alpha)
 
 
 def test_same_results_prefit_split() -> None:
@@ -254,9 +278,6 @@ def test_same_results_prefit_split() -> None:
     Test checking that if split and prefit method have exactly
     the same data split, then we have exactly the same results.
     """
-    X, y = make_regression(
-        n_samples=500, n_features=10, noise=1.0, random_state=1
-    )
     cv = ShuffleSplit(n_splits=1, test_size=0.1, random_state=random_state)
     train_index, val_index = list(cv.split(X))[0]
     X_train, X_calib = X[train_index], X[val_index]
@@ -272,63 +293,58 @@ def test_same_results_prefit_split() -> None:
     y_pred_2, y_pis_2 = mapie_reg.predict(X, alpha=0.1)
 
     np.testing.assert_allclose(y_pred_1, y_pred_2)
-    np.testing.assert_allclose(y_pis_1[:, 0, 0], y_pis_2[:, 0, 0])
-    np.testing.assert_allclose(y_pis_1[:, 1, 0], y_pis_2[:, 1, 0])
+    np.testing.assert_allclose(y_pis_1[:, :, 0], y_pis_2[:, :, 0])
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_for_same_alpha(strategy: str) -> None:
+def test_results_for_same_alpha(fitted_strategy: FittedStrategy) -> None:
     """
     Test that predictions and intervals
     are similar with two equal values of alpha.
     """
-    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
-    mapie_reg.fit(X, y)
+    _, mapie_reg, _ = fitted_strategy
     _, y_pis = mapie_reg.predict(X, alpha=[0.1, 0.1])
-    np.testing.assert_allclose(y_pis[:, 0, 0], y_pis[:, 0, 1])
-    np.testing.assert_allclose(y_pis[:, 1, 0], y_pis[:, 1, 1])
+    np.testing.assert_allclose(y_pis[:, :, 0], y_pis[:, :, 1])
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
 @pytest.mark.parametrize(
     "alpha", [np.array([0.05, 0.1]), [0.05, 0.1], (0.05, 0.1)]
 )
 def test_results_for_alpha_as_float_and_arraylike(
-    strategy: str, alpha: Any
+    fitted_strategy: FittedStrategy, alpha: Any
 ) -> None:
     """Test that output values do not depend on type of alpha."""
-    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
-    mapie_reg.fit(X, y)
+    _, mapie_reg, _ = fitted_strategy
     y_pred_float1, y_pis_float1 = mapie_reg.predict(X, alpha=alpha[0])
     y_pred_float2, y_pis_float2 = mapie_reg.predict(X, alpha=alpha[1])
     y_pred_array, y_pis_array = mapie_reg.predict(X, alpha=alpha)
-    np.testing.assert_allclose(y_pred_float1, y_pred_array)
-    np.testing.assert_allclose(y_pred_float2, y_pred_array)
-    np.testing.assert_allclose(y_pis_float1[:, :, 0], y_pis_array[:, :, 0])
-    np.testing.assert_allclose(y_pis_float2[:, :, 0], y_pis_array[:, :, 1])
+    np.testing.assert_allclose(
+        np.stack([y_pred_float1, y_pred_float2]),
+        np.stack([y_pred_array, y_pred_array])
+    )
+    np.testing.assert_allclose(
+        np.concatenate([y_pis_float1, y_pis_float2], axis=2), y_pis_array
+    )
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_for_ordered_alpha(strategy: str) -> None:
+def test_results_for_ordered_alpha(fitted_strategy: FittedStrategy) -> None:
     """
     Test that prediction intervals lower (upper) bounds give
     consistent results for ordered alphas.
     """
-    mapie = MapieRegressor(**STRATEGIES[strategy])
-    mapie.fit(X, y)
+    _, mapie, _ = fitted_strategy
     y_pred, y_pis = mapie.predict(X, alpha=[0.05, 0.1])
     assert (y_pis[:, 0, 0] <= y_pis[:, 0, 1]).all()
     assert (y_pis[:, 1, 0] >= y_pis[:, 1, 1]).all()
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_single_and_multi_jobs(strategy: str) -> None:
+@pytest.mark.parametrize("strategy_params", [*STRATEGIES], indirect=True)
+def test_results_single_and_multi_jobs(strategy_params: Params) -> None:
     """
     Test that MapieRegressor gives equal predictions
     regardless of number of parallel jobs.
     """
-    mapie_single = MapieRegressor(n_jobs=1, **STRATEGIES[strategy])
-    mapie_multi = MapieRegressor(n_jobs=-1, **STRATEGIES[strategy])
+    mapie_single = MapieRegressor(n_jobs=1, **strategy_params)
+    mapie_multi = MapieRegressor(n_jobs=-1, **strategy_params)
     mapie_single.fit(X_toy, y_toy)
     mapie_multi.fit(X_toy, y_toy)
     y_pred_single, y_pis_single = mapie_single.predict(X_toy, alpha=0.2)
@@ -337,16 +353,18 @@ def test_results_single_and_multi_jobs(strategy: str) -> None:
     np.testing.assert_allclose(y_pis_single, y_pis_multi)
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_with_constant_sample_weights(strategy: str) -> None:
+@pytest.mark.parametrize("strategy_params", [*STRATEGIES], indirect=True)
+def test_results_with_constant_sample_weights(
+    strategy_params: Params
+) -> None:
     """
     Test predictions when sample weights are None
     or constant with different values.
     """
     n_samples = len(X)
-    mapie0 = MapieRegressor(**STRATEGIES[strategy])
-    mapie1 = MapieRegressor(**STRATEGIES[strategy])
-    mapie2 = MapieRegressor(**STRATEGIES[strategy])
+    mapie0 = MapieRegressor(**strategy_params)
+    mapie1 = MapieRegressor(**strategy_params)
+    mapie2 = MapieRegressor(**strategy_params)
     mapie0.fit(X, y, sample_weight=None)
     mapie1.fit(X, y, sample_weight=np.ones(shape=n_samples))
     mapie2.fit(X, y, sample_weight=np.ones(shape=n_samples) * 5)
@@ -359,11 +377,9 @@ def test_results_with_constant_sample_weights(strategy: str) -> None:
     np.testing.assert_allclose(y_pis1, y_pis2)
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_prediction_between_low_up(strategy: str) -> None:
+def test_prediction_between_low_up(fitted_strategy: FittedStrategy) -> None:
     """Test that prediction lies between low and up prediction intervals."""
-    mapie = MapieRegressor(**STRATEGIES[strategy])
-    mapie.fit(X, y)
+    _, mapie, _ = fitted_strategy
     y_pred, y_pis = mapie.predict(X, alpha=0.1)
     assert (y_pred >= y_pis[:, 0, 0]).all()
     assert (y_pred <= y_pis[:, 1, 0]).all()
@@ -380,34 +396,31 @@ def test_prediction_agg_function(method: str, agg_function: str) -> None:
     mapie.fit(X, y)
     y_pred_1, y_pis_1 = mapie.predict(X, ensemble=True, alpha=0.1)
     y_pred_2, y_pis_2 = mapie.predict(X, ensemble=False, alpha=0.1)
-    np.testing.assert_allclose(y_pis_1[:, 0, 0], y_pis_2[:, 0, 0])
-    np.testing.assert_allclose(y_pis_1[:, 1, 0], y_pis_2[:, 1, 0])
+    np.testing.assert_allclose(y_pis_1[:, :, 0], y_pis_2[:, :, 0])
     with pytest.raises(AssertionError):
         np.testing.assert_allclose(y_pred_1, y_pred_2)
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_linear_data_confidence_interval(strategy: str) -> None:
+def test_linear_data_confidence_interval(
+    fitted_strategy: FittedStrategy
+) -> None:
     """
     Test that MapieRegressor applied on a linear regression model
     fitted on a linear curve results in null uncertainty.
     """
-    mapie = MapieRegressor(**STRATEGIES[strategy])
-    mapie.fit(X_toy, y_toy)
+    _, _, mapie = fitted_strategy
     y_pred, y_pis = mapie.predict(X_toy, alpha=0.2)
     np.testing.assert_allclose(y_pis[:, 0, 0], y_pis[:, 1, 0])
     np.testing.assert_allclose(y_pred, y_pis[:, 0, 0])
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_linear_regression_results(strategy: str) -> None:
+def test_linear_regression_results(fitted_strategy: FittedStrategy) -> None:
     """
     Test expected prediction intervals for
     a multivariate linear regression problem
     with fixed random state.
     """
-    mapie = MapieRegressor(**STRATEGIES[strategy])
-    mapie.fit(X, y)
+    strategy, mapie, _ = fitted_strategy
     _, y_pis = mapie.predict(X, alpha=0.05)
     y_pred_low, y_pred_up = y_pis[:, 0, 0], y_pis[:, 1, 0]
     width_mean = (y_pred_up - y_pred_low).mean()
@@ -576,17 +589,17 @@ def test_pipeline_compatibility() -> None:
     mapie.predict(X)
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
+@pytest.mark.parametrize("strategy_params", [*STRATEGIES], indirect=True)
 @pytest.mark.parametrize(
     "conformity_score", [AbsoluteConformityScore(), GammaConformityScore()]
 )
 def test_conformity_score(
-    strategy: str, conformity_score: ConformityScore
+    strategy_params: Params, conformity_score: ConformityScore
 ) -> None:
     """Test that any conformity score function with MAPIE raises no error."""
     mapie_reg = MapieRegressor(
         conformity_score=conformity_score,
-        **STRATEGIES[strategy]
+        **strategy_params
     )
     mapie_reg.fit(X, y + 1e3)
     mapie_reg.predict(X, alpha=0.05)
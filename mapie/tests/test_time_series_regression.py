@@ -17,13 +17,16 @@ from mapie.regression import MapieTimeSeriesRegressor
 from mapie.subsample import BlockBootstrap
 
 random_state = 1
-X_toy = np.array(range(5)).reshape(-1, 1)
+X_toy = np.arange(5).reshape(-1, 1)
 y_toy = (5.0 + 2.0 * X_toy ** 1.1).flatten()
 X, y = make_regression(
     n_samples=500, n_features=10, noise=1.0, random_state=random_state
 )
 k = np.ones(shape=(5, X.shape[1]))
 METHODS = ["enbpi"]
+BLOCK_BOOTSTRAP = BlockBootstrap(
+    n_resamplings=30, n_blocks=5, random_state=random_state
+)
 UPDATE_DATA = ([6], 17.5)
 CONFORMITY_SCORES = [14.189 - 14.038, 17.5 - 18.665]
 
@@ -39,34 +42,22 @@ STRATEGIES = {
     "jackknife_enbpi_mean_ab_wopt": Params(
         method="enbpi",
         agg_function="mean",
-        cv=BlockBootstrap(
-            n_resamplings=30, n_blocks=5, random_state=random_state
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
     "jackknife_enbpi_median_ab_wopt": Params(
         method="enbpi",
         agg_function="median",
-        cv=BlockBootstrap(
-            n_resamplings=30,
-            n_blocks=5,
-            random_state=random_state,
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
     "jackknife_enbpi_mean_ab": Params(
         method="enbpi",
         agg_function="mean",
-        cv=BlockBootstrap(
-            n_resamplings=30, n_blocks=5, random_state=random_state
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
     "jackknife_enbpi_median_ab": Params(
         method="enbpi",
         agg_function="median",
-        cv=BlockBootstrap(
-            n_resamplings=30,
-            n_blocks=5,
-            random_state=random_state,
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
 }
 
@@ -134,8 +125,7 @@ def test_results_for_same_alpha(strategy: str) -> None:
     mapie_ts_reg = MapieTimeSeriesRegressor(**STRATEGIES[strategy])
     mapie_ts_reg.fit(X, y)
     _, y_pis = mapie_ts_reg.predict(X, alpha=[0.1, 0.1])
-    np.testing.assert_allclose(y_pis[:, 0, 0], y_pis[:, 0, 1])
-    np.testing.assert_allclose(y_pis[:, 1, 0], y_pis[:, 1, 1])
+    np.testing.assert_allclose(y_pis[:, :, 0], y_pis[:, :, 1])
 
 
 @pytest.mark.parametrize("strategy", [*STRATEGIES])
@@ -151,10 +141,13 @@ def test_results_for_alpha_as_float_and_arraylike(
     y_pred_float1, y_pis_float1 = mapie_ts_reg.predict(X, alpha=alpha[0])
     y_pred_float2, y_pis_float2 = mapie_ts_reg.predict(X, alpha=alpha[1])
     y_pred_array, y_pis_array = mapie_ts_reg.predict(X, alpha=alpha)
-    np.testing.assert_allclose(y_pred_float1, y_pred_array)
-    np.testing.assert_allclose(y_pred_float2, y_pred_array)
-    np.testing.assert_allclose(y_pis_float1[:, :, 0], y_pis_array[:, :, 0])
-    np.testing.assert_allclose(y_pis_float2[:, :, 0], y_pis_array[:, :, 1])
+    np.testing.assert_allclose(
+        np.stack([y_pred_float1, y_pred_float2]),
+        np.stack([y_pred_array, y_pred_array])
+    )
+    np.testing.assert_allclose(
+        np.concatenate([y_pis_float1, y_pis_float2], axis=2), y_pis_array
+    )
 
 
 @pytest.mark.parametrize("strategy", [*STRATEGIES])
@@ -227,8 +220,7 @@ def test_prediction_agg_function(
     mapie.fit(X, y)
     y_pred_1, y_pis_1 = mapie.predict(X, ensemble=True, alpha=alpha)
     y_pred_2, y_pis_2 = mapie.predict(X, ensemble=False, alpha=alpha)
-    np.testing.assert_allclose(y_pis_1[:, 0, 0], y_pis_2[:, 0, 0])
-    np.testing.assert_allclose(y_pis_1[:, 1, 0], y_pis_2[:, 1, 0])
+    np.testing.assert_allclose(y_pis_1[:, :, 0], y_pis_2[:, :, 0])
     with pytest.raises(AssertionError):
         np.testing.assert_allclose(y_pred_1, y_pred_2)
 
@@ -389,6 +381,5 @@ def test_consistent_class() -> None:
 
     y_pred_1, y_pis_1 = mapie_c1.predict(X, alpha=0.1)
     y_pred_2, y_pis_2 = mapie_c2.predict(X, alpha=0.1)
-    np.testing.assert_allclose(y_pis_1[:, 0, 0], y_pis_2[:, 0, 0])
-    np.testing.assert_allclose(y_pis_1[:, 1, 0], y_pis_2[:, 1, 0])
+    np.testing.assert_allclose(y_pis_1[:, :, 0], y_pis_2[:, :, 0])
     np.testing.assert_allclose(y_pred_1, y_pred_2)